@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import struct
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from daft.series import Series
+
+NUM_ROWS = 10_000_000
+NUM_SAMPLES = 256
+MAX_BUCKETS = 2**31 - 1
+
+
+# Reference Murmur3_x86_32 (seed 0) from https://iceberg.apache.org/spec/#appendix-b-32-bit-hash-requirements
+def murmur3_x86_32(data: bytes) -> int:
+    c1 = 0xCC9E2D51
+    c2 = 0x1B873593
+    h = 0
+    nblocks = len(data) // 4
+    for (k,) in struct.iter_unpack("<I", data[: nblocks * 4]):
+        k = (k * c1) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
+        k = (k * c2) & 0xFFFFFFFF
+        h ^= k
+        h = ((h << 13) | (h >> 19)) & 0xFFFFFFFF
+        h = (h * 5 + 0xE6546B64) & 0xFFFFFFFF
+
+    tail = data[nblocks * 4 :]
+    k = 0
+    for i, byte in enumerate(tail):
+        k |= byte << (8 * i)
+    if tail:
+        k = (k * c1) & 0xFFFFFFFF
+        k = ((k << 15) | (k >> 17)) & 0xFFFFFFFF
+        k = (k * c2) & 0xFFFFFFFF
+        h ^= k
+
+    h ^= len(data)
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & 0xFFFFFFFF
+    h ^= h >> 16
+    return h
+
+
+def reference_bucket(value, max_buckets: int) -> int:
+    if isinstance(value, int):
+        data = struct.pack("<q", value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+    else:
+        data = value
+    return (murmur3_x86_32(data) & 0x7FFFFFFF) % max_buckets
+
+
+def generate_int64() -> pa.Array:
+    rng = np.random.default_rng(0)
+    return pa.array(rng.integers(low=-(2**31), high=2**31, size=NUM_ROWS, dtype=np.int64))
+
+
+def generate_utf8() -> pa.Array:
+    return generate_int64().cast(pa.string())
+
+
+def generate_binary() -> pa.Array:
+    return generate_utf8().cast(pa.binary())
+
+
+@pytest.mark.benchmark(group="iceberg_bucket")
+@pytest.mark.parametrize(
+    "test_data_generator",
+    [
+        pytest.param(generate_int64, id="int64"),
+        pytest.param(generate_utf8, id="utf8"),
+        pytest.param(generate_binary, id="binary"),
+    ],
+)
+def test_iceberg_bucket(test_data_generator, benchmark) -> None:
+    """Iceberg bucketing (Murmur3) over NUM_ROWS values."""
+    arr = test_data_generator()
+    s = Series.from_arrow(arr)
+
+    def bench_iceberg_bucket() -> Series:
+        return s.partitioning.iceberg_bucket(MAX_BUCKETS)
+
+    result = benchmark(bench_iceberg_bucket).to_arrow()
+
+    sample = np.random.default_rng(1).choice(NUM_ROWS, size=NUM_SAMPLES, replace=False)
+    for i in sample.tolist():
+        assert result[i].as_py() == reference_bucket(arr[i].as_py(), MAX_BUCKETS)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections import defaultdict
 from datetime import date, datetime, time
 from decimal import Decimal
 from itertools import product
@@ -12,6 +13,47 @@ from daft import DataType, TimeUnit
 from daft.series import Series
 
 
+# The partitioning tests share many (input, dtype) pairs, so each cast Series is built once per module.
+@pytest.fixture(scope="module")
+def series_cache():
+    return {}
+
+
+def _series(cache, input, dtype):
+    key = (tuple(input), dtype)
+    s = cache.get(key)
+    if s is None:
+        s = Series.from_pylist(input).cast(dtype)
+        cache[key] = s
+    return s
+
+
+def assert_series_eq(series, expected, arrow_type=None, msg=None):
+    # Compares in arrow so that null positions and the physical type are checked too.
+    if not isinstance(expected, pa.Array):
+        expected = pa.array(expected, type=arrow_type)
+    assert series.to_arrow().equals(expected), msg
+
+
+# 1512151975038194us is 2017-12-01T18:12:55.038194, expressed in each timeunit.
+# The ns value keeps a sub-microsecond remainder so that its conversion has to floor.
+_TS_US = 1512151975038194
+_TS_BY_UNIT = {"ns": _TS_US * 1_000 + 111, "us": _TS_US, "ms": _TS_US // 1_000, "s": _TS_US // 1_000_000}
+
+
+@pytest.fixture(params=["ns", "us", "ms", "s"])
+def ts_series(request):
+    unit = request.param
+    return Series.from_arrow(pa.array([_TS_BY_UNIT[unit]], type=pa.timestamp(unit)))
+
+
+def test_partitioning_timeunits(ts_series):
+    assert_series_eq(ts_series.partitioning.days(), [date(2017, 12, 1)], pa.date32())
+    assert_series_eq(ts_series.partitioning.months(), [575], pa.int32())
+    assert_series_eq(ts_series.partitioning.years(), [47], pa.int32())
+    assert_series_eq(ts_series.partitioning.hours(), [420042], pa.int32())
+
+
 @pytest.mark.parametrize(
     "input,dtype,expected",
     [
@@ -19,10 +61,6 @@ from daft.series import Series
         ([-1, None, 17501], DataType.date(), [date(1969, 12, 31), None, date(2017, 12, 1)]),
         ([], DataType.date(), []),
         ([None], DataType.date(), [None]),
-        ([1512151975038194111], DataType.timestamp(timeunit=TimeUnit.from_str("ns")), [date(2017, 12, 1)]),
-        ([1512151975038194], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [date(2017, 12, 1)]),
-        ([1512151975038], DataType.timestamp(timeunit=TimeUnit.from_str("ms")), [date(2017, 12, 1)]),
-        ([1512151975], DataType.timestamp(timeunit=TimeUnit.from_str("s")), [date(2017, 12, 1)]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [date(1969, 12, 31)]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us"), timezone="-08:00"), [date(1969, 12, 31)]),
         (
@@ -32,11 +70,10 @@ from daft.series import Series
         ),
     ],
 )
-def test_partitioning_days(input, dtype, expected):
-    s = Series.from_pylist(input).cast(dtype)
+def test_partitioning_days(series_cache, input, dtype, expected):
+    s = _series(series_cache, input, dtype)
     d = s.partitioning.days()
-    assert d.datatype() == DataType.date()
-    assert d.to_pylist() == expected
+    assert_series_eq(d, expected, pa.date32())
 
 
 @pytest.mark.parametrize(
@@ -46,10 +83,6 @@ def test_partitioning_days(input, dtype, expected):
         ([-1, 0, -13, None, 17501], DataType.date(), [-1, 0, -1, None, 575]),
         ([], DataType.date(), []),
         ([None], DataType.date(), [None]),
-        ([1512151975038194111], DataType.timestamp(timeunit=TimeUnit.from_str("ns")), [575]),
-        ([1512151975038194], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [575]),
-        ([1512151975038], DataType.timestamp(timeunit=TimeUnit.from_str("ms")), [575]),
-        ([1512151975], DataType.timestamp(timeunit=TimeUnit.from_str("s")), [575]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [-1]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us"), timezone="-08:00"), [-1]),
         (
@@ -59,11 +92,10 @@ def test_partitioning_days(input, dtype, expected):
         ),
     ],
 )
-def test_partitioning_months(input, dtype, expected):
-    s = Series.from_pylist(input).cast(dtype)
+def test_partitioning_months(series_cache, input, dtype, expected):
+    s = _series(series_cache, input, dtype)
     m = s.partitioning.months()
-    assert m.datatype() == DataType.int32()
-    assert m.to_pylist() == expected
+    assert_series_eq(m, expected, pa.int32())
 
 
 @pytest.mark.parametrize(
@@ -74,28 +106,19 @@ def test_partitioning_months(input, dtype, expected):
         ([], DataType.date(), []),
         ([None], DataType.date(), [None]),
         ([-364, -366, 364, 366], DataType.date(), [-1, -2, 0, 1]),
-        ([1512151975038194111], DataType.timestamp(timeunit=TimeUnit.from_str("ns")), [47]),
-        ([1512151975038194], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [47]),
-        ([1512151975038], DataType.timestamp(timeunit=TimeUnit.from_str("ms")), [47]),
-        ([1512151975], DataType.timestamp(timeunit=TimeUnit.from_str("s")), [47]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [-1]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us"), timezone="-08:00"), [-1]),
     ],
 )
-def test_partitioning_years(input, dtype, expected):
-    s = Series.from_pylist(input).cast(dtype)
+def test_partitioning_years(series_cache, input, dtype, expected):
+    s = _series(series_cache, input, dtype)
     y = s.partitioning.years()
-    assert y.datatype() == DataType.int32()
-    assert y.to_pylist() == expected
+    assert_series_eq(y, expected, pa.int32())
 
 
 @pytest.mark.parametrize(
     "input,dtype,expected",
     [
-        ([1512151975038194111], DataType.timestamp(timeunit=TimeUnit.from_str("ns")), [420042]),
-        ([1512151975038194], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [420042]),
-        ([1512151975038], DataType.timestamp(timeunit=TimeUnit.from_str("ms")), [420042]),
-        ([1512151975], DataType.timestamp(timeunit=TimeUnit.from_str("s")), [420042]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us")), [0]),
         ([-1], DataType.timestamp(timeunit=TimeUnit.from_str("us"), timezone="-08:00"), [0]),
         (
@@ -105,81 +128,131 @@ def test_partitioning_years(input, dtype, expected):
         ),
     ],
 )
-def test_partitioning_hours(input, dtype, expected):
-    s = Series.from_pylist(input).cast(dtype)
+def test_partitioning_hours(series_cache, input, dtype, expected):
+    s = _series(series_cache, input, dtype)
     h = s.partitioning.hours()
-    assert h.datatype() == DataType.int32()
-    assert h.to_pylist() == expected
+    assert_series_eq(h, expected, pa.int32())
+
+
+def test_partitioning_leaves_input_unchanged():
+    s = Series.from_pylist([-1, None, 17501]).cast(DataType.date())
+    before = s.to_arrow()
+    s.partitioning.days()
+    s.partitioning.months()
+    s.partitioning.years()
+    assert s.to_arrow().equals(before)
+
+
+_STRS = ("x", "y", None, "y", "x", None, "x")
+_INTS = (1, 2, 3, 2, 1, None)
+_DATES = (date(1920, 3, 1), date(1920, 3, 1), date(2020, 3, 1))
+_DTS = (datetime(1920, 3, 1), datetime(1920, 3, 1), datetime(2020, 3, 1))
+_DECS = tuple(Decimal(x) for x in ("1420", "1420", "14.20", ".1420", ".1420"))
+
+ICEBERG_BUCKETING_CASES = [
+    ("strs", _STRS),
+    ("ints", _INTS),
+    ("dates", _DATES),
+    ("datetimes", _DTS),
+    ("decimals", _DECS),
+]
+ICEBERG_BUCKETING_NS = [1, 4, 9]
 
 
 @pytest.mark.parametrize(
     "input,n",
-    product(
-        [
-            ["x", "y", None, "y", "x", None, "x"],
-            [1, 2, 3, 2, 1, None],
-            [date(1920, 3, 1), date(1920, 3, 1), date(2020, 3, 1)],
-            [datetime(1920, 3, 1), datetime(1920, 3, 1), datetime(2020, 3, 1)],
-            [Decimal("1420"), Decimal("1420"), Decimal("14.20"), Decimal(".1420"), Decimal(".1420")],
-        ],
-        [1, 4, 9],
-    ),
+    [(input, n) for (_, input), n in product(ICEBERG_BUCKETING_CASES, ICEBERG_BUCKETING_NS)],
+    ids=[f"{name}-n{n}" for (name, _), n in product(ICEBERG_BUCKETING_CASES, ICEBERG_BUCKETING_NS)],
 )
 def test_iceberg_bucketing(input, n):
-    s = Series.from_pylist(input)
+    s = Series.from_pylist(list(input))
     buckets = s.partitioning.iceberg_bucket(n)
     assert buckets.datatype() == DataType.int32()
-    seen = dict()
+    groups = defaultdict(list)
     for v, b in zip(input, buckets.to_pylist()):
+        groups[v].append(b)
+    for v, bs in groups.items():
+        assert all(b == bs[0] for b in bs)
         if v is None:
-            assert b is None
+            assert bs[0] is None
         else:
-            assert b >= 0
-        if v in seen:
-            assert seen[v] == b
-        else:
-            seen[v] = b
+            assert bs[0] is not None and bs[0] >= 0
 
 
 @pytest.mark.parametrize(
     "input,expected",
     [
-        (pa.array([34], type=pa.int32()), 2017239379),
-        (pa.array([34], type=pa.int64()), 2017239379),
-        (pa.array([Decimal("14.20")]), -500754589),
-        (pa.array([date.fromisoformat("2017-11-16")]), -653330422),
-        (pa.array([time.fromisoformat("22:31:08")]), -662762989),
-        (pa.array([datetime.fromisoformat("2017-11-16T22:31:08")]), -2047944441),
-        (pa.array([datetime.fromisoformat("2017-11-16T22:31:08.000001")]), -1207196810),
-        (pa.array([datetime.fromisoformat("2017-11-16T14:31:08-08:00")]), -2047944441),
-        (pa.array([datetime.fromisoformat("2017-11-16T14:31:08.000001-08:00")]), -1207196810),
-        (pa.array([datetime.fromisoformat("2017-11-16T22:31:08")], type=pa.timestamp("ns")), -2047944441),
-        (pa.array([pd.to_datetime("2017-11-16T22:31:08.000001001")], type=pa.timestamp("ns")), -1207196810),
-        (pa.array([datetime.fromisoformat("2017-11-16T14:31:08-08:00")], type=pa.timestamp("ns")), -2047944441),
-        (pa.array([pd.to_datetime("2017-11-16T14:31:08.000001001-08:00")], type=pa.timestamp("ns")), -1207196810),
-        (pa.array(["iceberg"]), 1210000089),
-        (pa.array([b"\x00\x01\x02\x03"]), -188683207),
+        pytest.param(pa.array([34], type=pa.int32()), [2017239379], id="int32"),
+        pytest.param(pa.array([34], type=pa.int64()), [2017239379], id="int64"),
+        pytest.param(pa.array([Decimal("14.20")]), [-500754589], id="decimal"),
+        pytest.param(pa.array([date.fromisoformat("2017-11-16")]), [-653330422], id="date32"),
+        pytest.param(pa.array([time.fromisoformat("22:31:08")]), [-662762989], id="time64"),
+        pytest.param(
+            pa.array(
+                [
+                    datetime.fromisoformat("2017-11-16T22:31:08"),
+                    datetime.fromisoformat("2017-11-16T22:31:08.000001"),
+                ]
+            ),
+            [-2047944441, -1207196810],
+            id="timestamp-us",
+        ),
+        pytest.param(
+            pa.array(
+                [
+                    datetime.fromisoformat("2017-11-16T14:31:08-08:00"),
+                    datetime.fromisoformat("2017-11-16T14:31:08.000001-08:00"),
+                ]
+            ),
+            [-2047944441, -1207196810],
+            id="timestamp-us-tz",
+        ),
+        pytest.param(
+            pa.array(
+                [
+                    datetime.fromisoformat("2017-11-16T22:31:08"),
+                    pd.to_datetime("2017-11-16T22:31:08.000001001"),
+                ],
+                type=pa.timestamp("ns"),
+            ),
+            [-2047944441, -1207196810],
+            id="timestamp-ns",
+        ),
+        pytest.param(
+            pa.array(
+                [
+                    datetime.fromisoformat("2017-11-16T14:31:08-08:00"),
+                    pd.to_datetime("2017-11-16T14:31:08.000001001-08:00"),
+                ],
+                type=pa.timestamp("ns"),
+            ),
+            [-2047944441, -1207196810],
+            id="timestamp-ns-tz",
+        ),
+        pytest.param(pa.array(["iceberg"]), [1210000089], id="utf8"),
+        pytest.param(pa.array([b"\x00\x01\x02\x03"]), [-188683207], id="binary"),
     ],
 )
 def test_iceberg_bucketing_hash(input, expected):
     # https://iceberg.apache.org/spec/#appendix-b-32-bit-hash-requirements
+    # Values of the same arrow type are hashed together in a single kernel call.
     max_buckets = 2**31 - 1
     s = Series.from_arrow(input)
     buckets = s.partitioning.iceberg_bucket(max_buckets)
     assert buckets.datatype() == DataType.int32()
-    assert buckets.to_pylist() == [(expected & max_buckets) % max_buckets]
+    assert_series_eq(buckets, [(e & max_buckets) % max_buckets for e in expected], pa.int32())
 
 
 def test_iceberg_truncate_decimal():
-    data = ["12.34", "12.30", "12.29", "0.05", "-0.05"]
-    data = [Decimal(v) for v in data] + [None]
-    expected = ["12.30", "12.30", "12.20", "0.00", "-0.10"]
-    expected = [Decimal(v) for v in expected] + [None]
+    data = ["12.34", "12.30", "12.29", "0.05", "-0.05", None]
+    expected = ["12.30", "12.30", "12.20", "0.00", "-0.10", None]
+    # pa.array cannot build decimals from strings, so they are cast instead.
+    arrow_type = pa.decimal128(5, 2)
 
-    s = Series.from_pylist(data)
+    s = Series.from_arrow(pa.array(data).cast(arrow_type))
     trunc = s.partitioning.iceberg_truncate(10)
     assert trunc.datatype() == s.datatype()
-    assert trunc.to_pylist() == expected
+    assert_series_eq(trunc, pa.array(expected).cast(arrow_type))
 
 
 @pytest.mark.parametrize(
@@ -195,15 +268,14 @@ def test_iceberg_truncate_signed_int(dtype):
     data = [0, 1, 5, 9, 10, 11, -1, -5, -10, -11, None]
     expected = [0, 0, 0, 0, 10, 10, -10, -10, -10, -20, None]
 
-    s = Series.from_pylist(data).cast(dtype)
+    s = Series.from_arrow(pa.array(data, type=dtype.to_arrow_dtype()))
     trunc = s.partitioning.iceberg_truncate(10)
     assert trunc.datatype() == s.datatype()
-    assert trunc.to_pylist() == expected
+    assert_series_eq(trunc, expected, dtype.to_arrow_dtype())
 
 
-@pytest.mark.parametrize(
-    "dtype",
-    [
+def test_iceberg_truncate_all_int():
+    dtypes = [
         DataType.uint8(),
         DataType.uint16(),
         DataType.uint32(),
@@ -212,16 +284,15 @@ def test_iceberg_truncate_signed_int(dtype):
         DataType.int16(),
         DataType.int32(),
         DataType.int64(),
-    ],
-)
-def test_iceberg_truncate_all_int(dtype):
+    ]
     data = [0, 1, 5, 9, 10, 11, None]
     expected = [0, 0, 0, 0, 10, 10, None]
 
-    s = Series.from_pylist(data).cast(dtype)
-    trunc = s.partitioning.iceberg_truncate(10)
-    assert trunc.datatype() == s.datatype()
-    assert trunc.to_pylist() == expected
+    series = {dtype: Series.from_arrow(pa.array(data, type=dtype.to_arrow_dtype())) for dtype in dtypes}
+    truncs = {dtype: s.partitioning.iceberg_truncate(10) for dtype, s in series.items()}
+    for dtype, trunc in truncs.items():
+        assert trunc.datatype() == dtype, dtype
+        assert_series_eq(trunc, expected, dtype.to_arrow_dtype(), msg=dtype)
 
 
 def test_iceberg_truncate_str():
@@ -230,4 +301,4 @@ def test_iceberg_truncate_str():
     s = Series.from_pylist(data)
     trunc = s.partitioning.iceberg_truncate(5)
     assert trunc.datatype() == s.datatype()
-    assert trunc.to_pylist() == expected
+    assert_series_eq(trunc, expected, pa.large_string())